@@ -1,18 +1,31 @@
 from fastapi import FastAPI, File, UploadFile, Form, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 import rasterio
-from rasterio.warp import transform_bounds, calculate_default_transform
 from rasterio.crs import CRS
 from rasterio.windows import Window
 import numpy as np
+from pyproj import Transformer
+
+# GDAL's Python bindings are optional; without them tiles are copied through rasterio
+try:
+    from osgeo import gdal
+    gdal.UseExceptions()
+except ImportError:
+    gdal = None
 import tempfile
 import os
 import shutil
-from typing import List, Dict, Any, Tuple
+import io
+import zipfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Dict, Any, Tuple, Iterator
+from functools import lru_cache
 import logging
 from datetime import datetime
+from xml.sax.saxutils import escape as xml_escape
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -33,206 +46,601 @@ app.add_middleware(
 TILES_DIR = "tiles"
 os.makedirs(TILES_DIR, exist_ok=True)
 
+# Worker threads used for tile I/O (rasterio releases the GIL during reads/writes)
+TILE_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Chunk size used when copying uploads to disk
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+# Chunk size used when streaming files into ZIP downloads
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+# Internal nginx location that maps to TILES_DIR (e.g. "/internal-tiles").
+# When set, tile downloads are served by nginx via X-Accel-Redirect;
+# when empty, the API streams the file itself.
+TILES_ACCEL_REDIRECT = os.getenv("TILES_ACCEL_REDIRECT", "").rstrip("/")
+
+# Upper bound on the number of tiles a single upload may generate
+MAX_TILES = int(os.getenv("MAX_TILES", "100000"))
+
+# File name the uploaded raster is kept under when tiles are written as VRTs
+VRT_SOURCE_FILENAME = "source.tif"
+
+# Tiles are written as Cloud-Optimized GeoTIFFs with internal overviews
+TILE_DRIVER = "COG"
+
+# GDAL data type names for the dtypes rasterio reports
+VRT_DATA_TYPES = {
+    "uint8": "Byte",
+    "int8": "Int8",
+    "uint16": "UInt16",
+    "int16": "Int16",
+    "uint32": "UInt32",
+    "int32": "Int32",
+    "uint64": "UInt64",
+    "int64": "Int64",
+    "float32": "Float32",
+    "float64": "Float64",
+    "complex64": "CFloat32",
+    "complex128": "CFloat64",
+}
+
+# Per-tile metadata produced by generate_tiles
+TILE_DTYPE = np.dtype([
+    ('id', 'i4'),
+    ('min_lat', 'f8'),
+    ('max_lat', 'f8'),
+    ('min_lon', 'f8'),
+    ('max_lon', 'f8'),
+    ('col_start', 'i4'),
+    ('row_start', 'i4'),
+    ('col_end', 'i4'),
+    ('row_end', 'i4'),
+])
+
 # Mount static files for serving tiles
 app.mount("/tiles", StaticFiles(directory=TILES_DIR), name="tiles")
 
+# Frequently used CRSs (WGS84, Web Mercator, UTM north/south) resolved once at
+# import so per-request lookups do not have to query proj.db
+_CRS_CACHE = {
+    epsg: CRS.from_epsg(epsg)
+    for epsg in (4326, 3857, *range(32601, 32661), *range(32701, 32761))
+}
+
+def get_crs(epsg: int) -> CRS:
+    """Return the CRS for an EPSG code, served from the in-process table when possible"""
+    crs = _CRS_CACHE.get(epsg)
+    return crs if crs is not None else CRS.from_epsg(epsg)
+
+def is_wgs84(crs: CRS) -> bool:
+    """Check whether a CRS is WGS84, trying a direct comparison before the EPSG lookup"""
+    return crs == get_crs(4326) or crs.to_epsg() == 4326
+
+@lru_cache(maxsize=64)
+def cached_transformer(src_wkt: str, dst_epsg: int) -> Transformer:
+    """
+    Return a (cached) Transformer from a source CRS to an EPSG code.
+    
+    Building a PROJ pipeline is expensive, so transformers are reused across
+    requests. The source CRS is keyed by its WKT string because CRS objects
+    are not reliably hashable.
+    
+    Args:
+        src_wkt: WKT representation of the source CRS
+        dst_epsg: EPSG code of the destination CRS
+        
+    Returns:
+        pyproj Transformer using longitude/latitude (x, y) axis order
+    """
+    return Transformer.from_crs(src_wkt, get_crs(dst_epsg).to_wkt(), always_xy=True)
+
 def read_raster_bounds(file_path: str) -> Dict[str, float]:
+    """
+    Read raster bounds from a file path. See read_raster_bounds_ds.
+    """
+    with rasterio.open(file_path) as dataset:
+        return read_raster_bounds_ds(dataset)
+
+def read_raster_bounds_ds(dataset) -> Dict[str, float]:
     """
     Read raster bounds and convert to EPSG:4326 (WGS84) if needed.
     
     Args:
-        file_path: Path to the GeoTIFF file
+        dataset: Open rasterio dataset of the GeoTIFF file
         
     Returns:
         Dictionary with min_lat, max_lat, min_lon, max_lon in WGS84
         
     Raises:
-        Exception: If file cannot be read or CRS transformation fails
+        Exception: If CRS transformation fails
     """
     try:
-        with rasterio.open(file_path) as dataset:
-            # Get the bounds in the original CRS
-            bounds = dataset.bounds
-            src_crs = dataset.crs
-            
-            logger.info(f"Original CRS: {src_crs}")
-            logger.info(f"Original bounds: {bounds}")
+        # Get the bounds in the original CRS
+        bounds = dataset.bounds
+        src_crs = dataset.crs
+        
+        logger.info(f"Original CRS: {src_crs}")
+        logger.info(f"Original bounds: {bounds}")
+        
+        # If already in WGS84, return bounds directly
+        if src_crs and is_wgs84(src_crs):
+            return {
+                "min_lon": float(bounds.left),
+                "min_lat": float(bounds.bottom),
+                "max_lon": float(bounds.right),
+                "max_lat": float(bounds.top)
+            }
+        
+        # Transform bounds to WGS84
+        if src_crs:
+            # Transform bounds from source CRS to WGS84
+            min_lon, min_lat, max_lon, max_lat = cached_transformer(
+                src_crs.to_wkt(), 4326
+            ).transform_bounds(*bounds)
             
-            # If already in WGS84, return bounds directly
-            if src_crs and src_crs.to_epsg() == 4326:
-                return {
-                    "min_lon": float(bounds.left),
-                    "min_lat": float(bounds.bottom),
-                    "max_lon": float(bounds.right),
-                    "max_lat": float(bounds.top)
-                }
+            return {
+                "min_lon": float(min_lon),
+                "min_lat": float(min_lat),
+                "max_lon": float(max_lon),
+                "max_lat": float(max_lat)
+            }
+        else:
+            # If no CRS information, assume it's already in WGS84
+            logger.warning("No CRS information found, assuming WGS84")
+            return {
+                "min_lon": float(bounds.left),
+                "min_lat": float(bounds.bottom),
+                "max_lon": float(bounds.right),
+                "max_lat": float(bounds.top)
+            }
             
-            # Transform bounds to WGS84
-            if src_crs:
-                # Transform bounds from source CRS to WGS84
-                min_lon, min_lat, max_lon, max_lat = transform_bounds(
-                    src_crs, CRS.from_epsg(4326), *bounds
-                )
-                
-                return {
-                    "min_lon": float(min_lon),
-                    "min_lat": float(min_lat),
-                    "max_lon": float(max_lon),
-                    "max_lat": float(max_lat)
-                }
-            else:
-                # If no CRS information, assume it's already in WGS84
-                logger.warning("No CRS information found, assuming WGS84")
-                return {
-                    "min_lon": float(bounds.left),
-                    "min_lat": float(bounds.bottom),
-                    "max_lon": float(bounds.right),
-                    "max_lat": float(bounds.top)
-                }
-                
     except Exception as e:
         logger.error(f"Error reading raster bounds: {str(e)}")
         raise Exception(f"Failed to read raster bounds: {str(e)}")
 
-def generate_tiles(file_path: str, tile_width: int, tile_height: int, overlap: float, session_id: str) -> List[Dict[str, Any]]:
+def compute_tile_bounds(
+    transform, src_crs, needs_reproject: bool, col_starts: np.ndarray,
+    row_starts: np.ndarray, col_ends: np.ndarray, row_ends: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Compute WGS84 bounding boxes for many tiles at once.
+
+    The four pixel corners of every tile are mapped through the affine
+    transform and reprojected with a single Transformer call.
+
+    Args:
+        transform: Affine transform of the source dataset
+        src_crs: CRS of the source dataset
+        needs_reproject: Whether src_crs differs from WGS84 (computed once by the caller)
+        col_starts, row_starts, col_ends, row_ends: Pixel bounds of each tile (any numeric dtype)
+
+    Returns:
+        Tuple of (min_lons, min_lats, max_lons, max_lats) arrays, one entry per tile
+    """
+    num_tiles = len(col_starts)
+
+    # Corner order per tile: top-left, top-right, bottom-right, bottom-left
+    cols = np.stack([col_starts, col_ends, col_ends, col_starts], axis=1).ravel()
+    rows = np.stack([row_starts, row_starts, row_ends, row_ends], axis=1).ravel()
+
+    xs = transform.a * cols + transform.b * rows + transform.c
+    ys = transform.d * cols + transform.e * rows + transform.f
+
+    # If source CRS is not WGS84, transform coordinates
+    if needs_reproject:
+        xs, ys = cached_transformer(src_crs.to_wkt(), 4326).transform(xs, ys)
+
+    # Reduce each tile's four corners in one vectorized pass per axis
+    lons = np.asarray(xs).reshape(num_tiles, 4)
+    lats = np.asarray(ys).reshape(num_tiles, 4)
+
+    return lons.min(axis=1), lats.min(axis=1), lons.max(axis=1), lats.max(axis=1)
+
+def tile_file_name(tile_id: int, materialize: bool = True) -> str:
+    """Return the file name of a tile: a GeoTIFF, or a VRT for virtual tiles"""
+    return f"tile_{tile_id:06d}.tif" if materialize else f"tile_{tile_id:06d}.vrt"
+
+def tile_records(tiles: np.ndarray, session_id: str, materialize: bool = True) -> List[Dict[str, Any]]:
+    """
+    Convert tile metadata produced by generate_tiles into response dictionaries.
+    
+    Args:
+        tiles: Structured array (TILE_DTYPE) of tile metadata
+        session_id: Session identifier the tiles were saved under
+        materialize: Whether the tiles were written as GeoTIFFs or as VRTs
+        
+    Returns:
+        List of tile dictionaries with geographic bounding boxes and file paths
+    """
+    session_dir = os.path.join(TILES_DIR, session_id)
+    records = []
+    
+    for tile_id, min_lat, max_lat, min_lon, max_lon, col_start, row_start, col_end, row_end in tiles.tolist():
+        tile_filename = tile_file_name(tile_id, materialize)
+        records.append({
+            "id": tile_id,
+            "min_lat": min_lat,
+            "max_lat": max_lat,
+            "min_lon": min_lon,
+            "max_lon": max_lon,
+            "pixel_bounds": {
+                "col_start": col_start,
+                "row_start": row_start,
+                "col_end": col_end,
+                "row_end": row_end
+            },
+            "file_path": os.path.join(session_dir, tile_filename),
+            "file_name": tile_filename,
+            "download_url": f"/download-tile/{session_id}/{tile_filename}"
+        })
+    
+    return records
+
+class ThreadLocalDatasets:
+    """
+    Lazily opens one read handle on a raster per worker thread.
+    
+    GDAL dataset handles must not be shared between threads, so every thread
+    gets its own handle. All handles are closed together by close().
+    Each thread also keeps one read buffer sized for a full tile, which is
+    reused for every window it reads.
+    """
+    
+    def __init__(self, file_path: str, tile_width: int, tile_height: int):
+        self.file_path = file_path
+        self.tile_width = tile_width
+        self.tile_height = tile_height
+        self._local = threading.local()
+        self._opened = []
+        self._gdal_opened = []
+        self._lock = threading.Lock()
+    
+    def get(self):
+        """Return the dataset handle for the calling thread"""
+        dataset = getattr(self._local, "dataset", None)
+        if dataset is None:
+            dataset = rasterio.open(self.file_path)
+            self._local.dataset = dataset
+            with self._lock:
+                self._opened.append(dataset)
+        return dataset
+    
+    def get_gdal(self):
+        """Return the GDAL dataset handle for the calling thread"""
+        dataset = getattr(self._local, "gdal_dataset", None)
+        if dataset is None:
+            dataset = gdal.Open(self.file_path)
+            self._local.gdal_dataset = dataset
+            with self._lock:
+                self._gdal_opened.append(dataset)
+        return dataset
+    
+    def read(self, window: Window) -> np.ndarray:
+        """
+        Read a window into the calling thread's reusable buffer.
+        
+        The returned array is a view on that buffer and is only valid until
+        the same thread reads its next window.
+        """
+        dataset = self.get()
+        buffer = getattr(self._local, "buffer", None)
+        if buffer is None:
+            buffer = np.empty(dataset.count * self.tile_height * self.tile_width, dtype=dataset.dtypes[0])
+            self._local.buffer = buffer
+        
+        shape = (dataset.count, int(window.height), int(window.width))
+        out = buffer[:shape[0] * shape[1] * shape[2]].reshape(shape)
+        return dataset.read(window=window, out=out)
+    
+    def close(self):
+        """Close every handle opened so far"""
+        with self._lock:
+            for dataset in self._opened:
+                dataset.close()
+            self._opened.clear()
+            # GDAL datasets are closed when their last reference is dropped
+            self._gdal_opened.clear()
+
+def tile_creation_options(dtype) -> Dict[str, Any]:
+    """
+    Cloud-Optimized GeoTIFF creation options for tile output.
+    
+    Tiles are written by GDAL's COG driver with a 256x256 block layout,
+    DEFLATE compression and internal overviews (built in the same pass
+    until they fit in one block). The predictor is chosen from the data
+    type: horizontal differencing for integers, floating point for floats
+    and none otherwise. Compression stays single-threaded per tile because
+    tiles are already written in parallel on TILE_WORKERS threads.
+    
+    Args:
+        dtype: NumPy data type of the tile pixels
+        
+    Returns:
+        Keyword arguments for rasterio.open in write mode
+    """
+    if np.issubdtype(dtype, np.integer):
+        predictor = "standard"
+    elif np.issubdtype(dtype, np.floating):
+        predictor = "floating_point"
+    else:
+        predictor = "no"
+    
+    return {
+        "blocksize": 256,
+        "compress": "deflate",
+        "predictor": predictor,
+        "overview_resampling": "nearest"
+    }
+
+def gdal_creation_options(options: Dict[str, Any]) -> List[str]:
+    """
+    Convert rasterio-style creation options into GDAL KEY=VALUE strings.
+    
+    Args:
+        options: Creation options as returned by tile_creation_options
+        
+    Returns:
+        List of creation option strings for gdal.Translate
+    """
+    return [
+        f"{key.upper()}={'YES' if value is True else 'NO' if value is False else str(value).upper()}"
+        for key, value in options.items()
+    ]
+
+def write_tile(
+    datasets: ThreadLocalDatasets, window: Window, tile_transform, tile_path: str,
+    src_crs, creation_options: Dict[str, Any]
+) -> None:
+    """
+    Copy one tile window from the source raster into its own Cloud-Optimized GeoTIFF.
+    
+    When GDAL's Python bindings are available the window is copied with
+    gdal.Translate, which stays inside GDAL and can reuse source blocks.
+    Otherwise the window is read into NumPy and written with rasterio.
+    
+    Args:
+        datasets: Per-thread handles on the source raster
+        window: Pixel window of the tile
+        tile_transform: Affine transform of the tile
+        tile_path: Output path for the tile GeoTIFF
+        src_crs: CRS written to the tile
+        creation_options: GeoTIFF creation options from tile_creation_options
+    """
+    if gdal is not None:
+        tile_dataset = gdal.Translate(
+            tile_path,
+            datasets.get_gdal(),
+            format=TILE_DRIVER,
+            srcWin=[window.col_off, window.row_off, window.width, window.height],
+            creationOptions=gdal_creation_options(creation_options)
+        )
+        # Dropping the reference flushes and closes the output file
+        tile_dataset = None
+        return
+    
+    tile_data = datasets.read(window)
+    
+    with rasterio.open(
+        tile_path,
+        'w',
+        driver=TILE_DRIVER,
+        height=tile_data.shape[1],
+        width=tile_data.shape[2],
+        count=tile_data.shape[0],
+        dtype=tile_data.dtype,
+        crs=src_crs,
+        transform=tile_transform,
+        **creation_options
+    ) as tile_dataset:
+        tile_dataset.write(tile_data)
+
+def write_tile_vrt(dataset, window: Window, tile_transform, tile_path: str, source_name: str) -> None:
+    """
+    Save one tile as a VRT that points at a window of the source raster.
+    
+    Args:
+        dataset: Open source dataset (used for band count, data types and CRS)
+        window: Pixel window of the tile
+        tile_transform: Affine transform of the tile
+        tile_path: Output path for the tile VRT
+        source_name: Source raster path, relative to the directory of tile_path
+    """
+    col_off, row_off = int(window.col_off), int(window.row_off)
+    tile_w, tile_h = int(window.width), int(window.height)
+    
+    lines = [f'<VRTDataset rasterXSize="{tile_w}" rasterYSize="{tile_h}">']
+    if dataset.crs:
+        lines.append(f'  <SRS>{xml_escape(dataset.crs.to_wkt())}</SRS>')
+    lines.append(f'  <GeoTransform>{", ".join(repr(v) for v in tile_transform.to_gdal())}</GeoTransform>')
+    
+    for band, dtype in enumerate(dataset.dtypes, start=1):
+        lines.append(f'  <VRTRasterBand dataType="{VRT_DATA_TYPES[dtype]}" band="{band}">')
+        nodata = dataset.nodatavals[band - 1]
+        if nodata is not None:
+            lines.append(f'    <NoDataValue>{nodata!r}</NoDataValue>')
+        lines.extend([
+            '    <SimpleSource>',
+            f'      <SourceFilename relativeToVRT="1">{xml_escape(source_name)}</SourceFilename>',
+            f'      <SourceBand>{band}</SourceBand>',
+            f'      <SrcRect xOff="{col_off}" yOff="{row_off}" xSize="{tile_w}" ySize="{tile_h}" />',
+            f'      <DstRect xOff="0" yOff="0" xSize="{tile_w}" ySize="{tile_h}" />',
+            '    </SimpleSource>',
+            '  </VRTRasterBand>',
+        ])
+    lines.append('</VRTDataset>')
+    
+    with open(tile_path, 'w') as f:
+        f.write("\n".join(lines) + "\n")
+
+def tile_grid(width: int, height: int, tile_width: int, tile_height: int, overlap: float) -> Tuple[int, int, int, int]:
+    """
+    Compute the tiling grid for a raster without touching its pixels.
+    
+    Args:
+        width: Raster width in pixels
+        height: Raster height in pixels
+        tile_width: Width of each tile in pixels
+        tile_height: Height of each tile in pixels
+        overlap: Overlap ratio between 0 and 1
+        
+    Returns:
+        Tuple of (step_size_x, step_size_y, num_tiles_x, num_tiles_y)
+    """
+    # Calculate step size based on tile dimensions and overlap (at least one pixel)
+    step_size_x = max(1, int(tile_width * (1 - overlap)))
+    step_size_y = max(1, int(tile_height * (1 - overlap)))
+    
+    # Calculate number of tiles needed
+    num_tiles_x = int(np.ceil(width / step_size_x))
+    num_tiles_y = int(np.ceil(height / step_size_y))
+    
+    return step_size_x, step_size_y, num_tiles_x, num_tiles_y
+
+def generate_tiles(
+    file_path: str, tile_width: int, tile_height: int, overlap: float, session_id: str,
+    materialize: bool = True
+) -> np.ndarray:
+    """
+    Generate tiles for a raster file path. See generate_tiles_ds.
+    """
+    with rasterio.open(file_path) as dataset:
+        return generate_tiles_ds(dataset, tile_width, tile_height, overlap, session_id, materialize)
+
+def generate_tiles_ds(
+    dataset, tile_width: int, tile_height: int, overlap: float, session_id: str,
+    materialize: bool = True
+) -> np.ndarray:
     """
     Generate tiles for a raster dataset with specified size and overlap.
-    Saves actual tile images to disk.
+    Saves actual tile images to disk, or one VRT per tile when not materializing.
     
     Args:
-        file_path: Path to the GeoTIFF file
+        dataset: Open rasterio dataset of the GeoTIFF file; worker threads
+            reopen it by path (dataset.name)
         tile_width: Width of each tile in pixels (e.g., 512)
         tile_height: Height of each tile in pixels (e.g., 256)
         overlap: Overlap ratio between 0 and 1 (e.g., 0.5 for 50% overlap)
         session_id: Unique session identifier for organizing tiles
+        materialize: Write GeoTIFF tiles (True) or VRTs that reference the dataset (False).
+            VRTs store the dataset path relative to the session directory, so the
+            source must stay in place for as long as the tiles are used.
         
     Returns:
-        List of tile dictionaries with geographic bounding boxes and file paths
+        Structured array (TILE_DTYPE) with one row per saved tile holding its
+        id, geographic bounding box and pixel bounds
         
     Raises:
-        Exception: If file cannot be read or tiling fails
+        Exception: If tiling fails
     """
     try:
         # Create session directory for tiles
         session_dir = os.path.join(TILES_DIR, session_id)
         os.makedirs(session_dir, exist_ok=True)
         
-        with rasterio.open(file_path) as dataset:
-            height, width = dataset.height, dataset.width
-            transform = dataset.transform
-            src_crs = dataset.crs
-            
-            logger.info(f"Raster dimensions: {width}x{height}")
-            logger.info(f"Transform: {transform}")
-            logger.info(f"CRS: {src_crs}")
-            logger.info(f"Saving tiles to: {session_dir}")
-            
-            # Calculate step size based on tile dimensions and overlap
-            step_size_x = int(tile_width * (1 - overlap))
-            step_size_y = int(tile_height * (1 - overlap))
-            
-            # Calculate number of tiles needed
-            num_tiles_x = int(np.ceil(width / step_size_x))
-            num_tiles_y = int(np.ceil(height / step_size_y))
+        height, width = dataset.height, dataset.width
+        transform = dataset.transform
+        src_crs = dataset.crs
+        
+        # Resolve the CRS once; a missing CRS is assumed to be WGS84
+        needs_reproject = bool(src_crs) and not is_wgs84(src_crs)
+        
+        logger.info(f"Raster dimensions: {width}x{height}")
+        logger.info(f"Transform: {transform}")
+        logger.info(f"CRS: {src_crs}")
+        logger.info(f"Saving tiles to: {session_dir}")
+        
+        step_size_x, step_size_y, num_tiles_x, num_tiles_y = tile_grid(
+            width, height, tile_width, tile_height, overlap
+        )
+        
+        # Refuse pathological grids before allocating anything per tile
+        if num_tiles_x * num_tiles_y > MAX_TILES:
+            raise Exception(f"{num_tiles_x * num_tiles_y} tiles exceeds cap {MAX_TILES}")
+        
+        logger.info(f"Generating {num_tiles_x}x{num_tiles_y} tiles with step size {step_size_x}x{step_size_y}")
+        
+        # Enumerate the tiling grid; tile ids follow column-major order
+        col_starts, row_starts = np.meshgrid(
+            np.arange(num_tiles_x) * step_size_x,
+            np.arange(num_tiles_y) * step_size_y,
+            indexing='ij'
+        )
+        col_ends = np.minimum(col_starts + tile_width, width)
+        row_ends = np.minimum(row_starts + tile_height, height)
+        
+        # Skip tiles that are too small (less than 10% of tile dimensions)
+        keep = (col_ends - col_starts >= tile_width * 0.1) & (row_ends - row_starts >= tile_height * 0.1)
+        
+        tiles = np.zeros(np.count_nonzero(keep), dtype=TILE_DTYPE)
+        tiles['id'] = np.arange(1, len(tiles) + 1)
+        tiles['col_start'] = col_starts[keep]
+        tiles['row_start'] = row_starts[keep]
+        tiles['col_end'] = col_ends[keep]
+        tiles['row_end'] = row_ends[keep]
+        
+        tile_jobs = []
+        for tile_id, col_start, row_start, col_end, row_end in zip(
+            *(tiles[field].tolist() for field in ('id', 'col_start', 'row_start', 'col_end', 'row_end'))
+        ):
+            # Create window for reading tile data
+            window = Window(col_start, row_start, col_end - col_start, row_end - row_start)
             
-            logger.info(f"Generating {num_tiles_x}x{num_tiles_y} tiles with step size {step_size_x}x{step_size_y}")
+            # Calculate tile transform
+            tile_transform = rasterio.windows.transform(window, dataset.transform)
             
-            tiles = []
-            tile_id = 1
-            
-            for i in range(num_tiles_x):
-                for j in range(num_tiles_y):
-                    # Calculate pixel window boundaries
-                    col_start = i * step_size_x
-                    row_start = j * step_size_y
-                    col_end = min(col_start + tile_width, width)
-                    row_end = min(row_start + tile_height, height)
-                    
-                    # Skip tiles that are too small (less than 10% of tile dimensions)
-                    if (col_end - col_start) < tile_width * 0.1 or (row_end - row_start) < tile_height * 0.1:
-                        continue
-                    
-                    # Create window for reading tile data
-                    window = Window(col_start, row_start, col_end - col_start, row_end - row_start)
-                    
-                    # Read tile data
-                    tile_data = dataset.read(window=window)
-                    
-                    # Calculate tile transform
-                    tile_transform = rasterio.windows.transform(window, dataset.transform)
-                    
-                    # Save tile as GeoTIFF
-                    tile_filename = f"tile_{tile_id:06d}.tif"
-                    tile_path = os.path.join(session_dir, tile_filename)
-                    
-                    try:
-                        with rasterio.open(
-                            tile_path,
-                            'w',
-                            driver='GTiff',
-                            height=tile_data.shape[1],
-                            width=tile_data.shape[2],
-                            count=tile_data.shape[0],
-                            dtype=tile_data.dtype,
-                            crs=src_crs,
-                            transform=tile_transform,
-                            compress='lzw'
-                        ) as tile_dataset:
-                            tile_dataset.write(tile_data)
-                        
-                        logger.info(f"Saved tile {tile_id}: {tile_filename}")
-                    except Exception as e:
-                        logger.error(f"Failed to save tile {tile_id}: {str(e)}")
-                        continue
-                    
-                    # Convert pixel coordinates to geographic coordinates
-                    # Get the four corners of the tile in pixel coordinates
-                    pixel_corners = [
-                        (col_start, row_start),  # top-left
-                        (col_end, row_start),    # top-right
-                        (col_end, row_end),      # bottom-right
-                        (col_start, row_end)     # bottom-left
-                    ]
-                    
-                    # Transform pixel coordinates to geographic coordinates
-                    geo_coords = []
-                    for col, row in pixel_corners:
-                        lon, lat = rasterio.transform.xy(transform, row, col)
-                        geo_coords.append((lon, lat))
-                    
-                    # If source CRS is not WGS84, transform coordinates
-                    if src_crs and src_crs.to_epsg() != 4326:
-                        from rasterio.warp import transform
-                        lons, lats = zip(*geo_coords)
-                        lons, lats = transform(src_crs, CRS.from_epsg(4326), lons, lats)
-                        geo_coords = list(zip(lons, lats))
-                    
-                    # Extract bounding box from transformed coordinates
-                    lons, lats = zip(*geo_coords)
-                    min_lon, max_lon = min(lons), max(lons)
-                    min_lat, max_lat = min(lats), max(lats)
-                    
-                    tiles.append({
-                        "id": tile_id,
-                        "min_lat": float(min_lat),
-                        "max_lat": float(max_lat),
-                        "min_lon": float(min_lon),
-                        "max_lon": float(max_lon),
-                        "pixel_bounds": {
-                            "col_start": col_start,
-                            "row_start": row_start,
-                            "col_end": col_end,
-                            "row_end": row_end
-                        },
-                        "file_path": tile_path,
-                        "file_name": tile_filename,
-                        "download_url": f"/download-tile/{session_id}/{tile_filename}"
-                    })
-                    tile_id += 1
-            
-            logger.info(f"Generated {len(tiles)} tiles and saved to {session_dir}")
-            return tiles
+            tile_filename = tile_file_name(tile_id, materialize)
+            tile_path = os.path.join(session_dir, tile_filename)
             
+            tile_jobs.append((tile_id, window, tile_transform, tile_filename, tile_path))
+        
+        saved = np.zeros(len(tiles), dtype=bool)
+        
+        if not materialize:
+            # Virtual tiles: one small VRT per window, no pixel data written
+            source_name = os.path.relpath(dataset.name, session_dir)
+            for k, (tile_id, window, tile_transform, tile_filename, tile_path) in enumerate(tile_jobs):
+                try:
+                    write_tile_vrt(dataset, window, tile_transform, tile_path, source_name)
+                    logger.debug("Saved tile %d: %s", tile_id, tile_filename)
+                    saved[k] = True
+                except Exception as e:
+                    logger.error(f"Failed to save tile {tile_id}: {str(e)}")
+        else:
+            # Read and save tiles concurrently; each worker thread reads through its own dataset handle
+            datasets = ThreadLocalDatasets(dataset.name, tile_width, tile_height)
+            creation_options = tile_creation_options(dataset.dtypes[0])
+            try:
+                with ThreadPoolExecutor(max_workers=TILE_WORKERS) as executor:
+                    futures = {
+                        executor.submit(
+                            write_tile, datasets, window, tile_transform, tile_path, src_crs, creation_options
+                        ): k
+                        for k, (_, window, tile_transform, _, tile_path) in enumerate(tile_jobs)
+                    }
+                    for future in as_completed(futures):
+                        k = futures[future]
+                        tile_id, tile_filename = tile_jobs[k][0], tile_jobs[k][3]
+                        try:
+                            future.result()
+                            logger.debug("Saved tile %d: %s", tile_id, tile_filename)
+                            saved[k] = True
+                        except Exception as e:
+                            logger.error(f"Failed to save tile {tile_id}: {str(e)}")
+            finally:
+                datasets.close()
+        
+        tiles = tiles[saved]
+        
+        # Convert pixel bounds of all saved tiles to WGS84 in a single pass
+        tiles['min_lon'], tiles['min_lat'], tiles['max_lon'], tiles['max_lat'] = compute_tile_bounds(
+            transform, src_crs, needs_reproject,
+            tiles['col_start'], tiles['row_start'], tiles['col_end'], tiles['row_end']
+        )
+        
+        logger.info(f"Generated {len(tiles)} tiles and saved to {session_dir}")
+        return tiles
+        
     except Exception as e:
         logger.error(f"Error generating tiles: {str(e)}")
         raise Exception(f"Failed to generate tiles: {str(e)}")
@@ -242,7 +650,8 @@ async def upload_geotiff_file(
     file: UploadFile = File(...),
     tile_width: int = Form(256),
     tile_height: int = Form(256),
-    overlap: float = Form(0.25)
+    overlap: float = Form(0.25),
+    materialize: bool = Form(True)
 ):
     """
     Upload and process GeoTIFF file to generate tiles.
@@ -262,27 +671,71 @@ async def upload_geotiff_file(
         # Generate unique session ID
         session_id = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{file.filename.split('.')[0]}"
         
-        # Save uploaded file temporarily
+        # Save uploaded file temporarily, streaming it in 1 MiB chunks
         with tempfile.NamedTemporaryFile(delete=False, suffix='.tif') as tmp_file:
-            content = await file.read()
-            tmp_file.write(content)
+            shutil.copyfileobj(file.file, tmp_file, UPLOAD_CHUNK_SIZE)
             tmp_file_path = tmp_file.name
         
         try:
-            # Read raster bounds
-            logger.info(f"Processing file: {file.filename}")
-            original_bbox = read_raster_bounds(tmp_file_path)
+            source_path = tmp_file_path
+            session_dir = os.path.join(TILES_DIR, session_id)
+            created_session_dir = False
+            if not materialize:
+                # Virtual tiles reference the upload, so keep it inside the session
+                try:
+                    os.makedirs(session_dir)
+                    created_session_dir = True
+                except FileExistsError:
+                    pass
+                source_path = os.path.join(session_dir, VRT_SOURCE_FILENAME)
             
-            # Generate tiles and save them
-            tiles = generate_tiles(tmp_file_path, tile_width, tile_height, overlap, session_id)
+            try:
+                if not materialize:
+                    shutil.move(tmp_file_path, source_path)
+                
+                # Open the raster once for bounds, validation and tiling
+                logger.info(f"Processing file: {file.filename}")
+                with rasterio.open(source_path) as dataset:
+                    original_bbox = read_raster_bounds_ds(dataset)
+                    
+                    # Virtual tiles need a VRT data type for every band
+                    unsupported = sorted(set(dataset.dtypes) - VRT_DATA_TYPES.keys())
+                    if not materialize and unsupported:
+                        raise HTTPException(
+                            status_code=400,
+                            detail=f"Unsupported data type for virtual tiles: {', '.join(unsupported)}"
+                        )
+                    
+                    # Reject oversized tiling requests from the header alone
+                    _, _, num_tiles_x, num_tiles_y = tile_grid(
+                        dataset.width, dataset.height, tile_width, tile_height, overlap
+                    )
+                    if num_tiles_x * num_tiles_y > MAX_TILES:
+                        raise HTTPException(
+                            status_code=413,
+                            detail=f"Too many tiles requested: {num_tiles_x * num_tiles_y} exceeds cap {MAX_TILES}"
+                        )
+                    
+                    # Generate tiles and save them
+                    tiles = generate_tiles_ds(dataset, tile_width, tile_height, overlap, session_id, materialize)
+            except Exception:
+                # A failed virtual-tile upload must not leave its copy behind; only remove
+                # the session directory if this request created it, since session ids can collide
+                if not materialize:
+                    if created_session_dir:
+                        shutil.rmtree(session_dir, ignore_errors=True)
+                    elif os.path.exists(source_path):
+                        os.unlink(source_path)
+                raise
             
             return {
                 "original_bbox": original_bbox,
-                "tiles": tiles,
+                "tiles": tile_records(tiles, session_id, materialize),
                 "total_tiles": len(tiles),
                 "tile_width": tile_width,
                 "tile_height": tile_height,
                 "overlap_ratio": overlap,
+                "materialize": materialize,
                 "session_id": session_id,
                 "tiles_directory": f"/tiles/{session_id}"
             }
@@ -307,51 +760,101 @@ async def root():
     }
 
 @app.get("/download-tile/{session_id}/{filename}")
+@app.head("/download-tile/{session_id}/{filename}")
 async def download_tile(session_id: str, filename: str):
-    """Download a specific tile file"""
+    """Download a specific tile file (HEAD returns only the headers)"""
     tile_path = os.path.join(TILES_DIR, session_id, filename)
     
     if not os.path.exists(tile_path):
         raise HTTPException(status_code=404, detail="Tile not found")
     
+    media_type = 'application/xml' if filename.endswith('.vrt') else 'image/tiff'
+    
+    # Behind nginx, hand the transfer off to sendfile via an internal location
+    if TILES_ACCEL_REDIRECT:
+        return Response(
+            media_type=media_type,
+            headers={
+                "X-Accel-Redirect": f"{TILES_ACCEL_REDIRECT}/{session_id}/{filename}",
+                "Content-Disposition": f"attachment; filename={filename}"
+            }
+        )
+    
     return FileResponse(
         path=tile_path,
         filename=filename,
-        media_type='image/tiff',
+        media_type=media_type,
         headers={"Content-Disposition": f"attachment; filename={filename}"}
     )
 
+class ZipStreamBuffer(io.RawIOBase):
+    """
+    Write-only, unseekable sink that collects bytes written by ZipFile.
+    
+    Because it cannot seek, ZipFile writes local headers followed by data
+    descriptors, so the archive can be sent while it is being built.
+    """
+    
+    def __init__(self):
+        super().__init__()
+        self._chunks = []
+    
+    def writable(self):
+        return True
+    
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        return len(data)
+    
+    def drain(self) -> bytes:
+        """Return and clear everything written since the last drain"""
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+def iter_zip(files: List[Tuple[str, str]]) -> Iterator[bytes]:
+    """
+    Stream an uncompressed ZIP archive of the given files.
+    
+    Tiles are already compressed GeoTIFFs, so entries are stored as-is
+    (ZIP_STORED) and only one read chunk is held in memory at a time.
+    
+    Args:
+        files: List of (file_path, arcname) pairs to include
+        
+    Yields:
+        Consecutive chunks of the ZIP archive
+    """
+    buffer = ZipStreamBuffer()
+    
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_STORED) as zip_file:
+        for file_path, arcname in files:
+            info = zipfile.ZipInfo.from_file(file_path, arcname)
+            with open(file_path, 'rb') as src, zip_file.open(info, 'w') as dst:
+                while chunk := src.read(DOWNLOAD_CHUNK_SIZE):
+                    dst.write(chunk)
+                    yield buffer.drain()
+            yield buffer.drain()
+    
+    yield buffer.drain()
+
 @app.get("/download-all-tiles/{session_id}")
 async def download_all_tiles(session_id: str):
     """Download all tiles as a ZIP file"""
-    import zipfile
-    from io import BytesIO
-    
     session_dir = os.path.join(TILES_DIR, session_id)
     
     if not os.path.exists(session_dir):
         raise HTTPException(status_code=404, detail="Session not found")
     
-    # Create ZIP file in memory
-    zip_buffer = BytesIO()
-    
-    with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-        for root, dirs, files in os.walk(session_dir):
-            for file in files:
-                file_path = os.path.join(root, file)
-                arcname = os.path.relpath(file_path, session_dir)
-                zip_file.write(file_path, arcname)
+    # Session directories are flat, so a single scandir pass is enough
+    with os.scandir(session_dir) as entries:
+        files = [(entry.path, entry.name) for entry in entries if entry.is_file()]
     
-    zip_buffer.seek(0)
-    zip_content = zip_buffer.getvalue()
-    
-    from fastapi.responses import Response
-    return Response(
-        content=zip_content,
+    return StreamingResponse(
+        iter_zip(files),
         media_type='application/zip',
         headers={
-            "Content-Disposition": f"attachment; filename=tiles_{session_id}.zip",
-            "Content-Length": str(len(zip_content))
+            "Content-Disposition": f"attachment; filename=tiles_{session_id}.zip"
         }
     )
 
@@ -363,16 +866,15 @@ async def list_tiles(session_id: str):
     if not os.path.exists(session_dir):
         raise HTTPException(status_code=404, detail="Session not found")
     
-    tiles = []
-    for filename in os.listdir(session_dir):
-        if filename.endswith('.tif'):
-            file_path = os.path.join(session_dir, filename)
-            file_size = os.path.getsize(file_path)
-            tiles.append({
-                "filename": filename,
-                "size_bytes": file_size,
-                "download_url": f"/download-tile/{session_id}/{filename}"
-            })
+    with os.scandir(session_dir) as entries:
+        tiles = [
+            {
+                "filename": entry.name,
+                "size_bytes": entry.stat().st_size,
+                "download_url": f"/download-tile/{session_id}/{entry.name}"
+            }
+            for entry in entries if entry.name.startswith('tile_') and entry.name.endswith(('.tif', '.vrt'))
+        ]
     
     return {
         "session_id": session_id,
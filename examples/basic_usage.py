@@ -1,86 +1,260 @@
 """
 Basic usage examples for RasterLab API
 """
+import asyncio
+import csv
+import importlib.util
 import requests
+import shutil
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import os
-from pathlib import Path
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+# Optional: async client for concurrent tile downloads, multiplexed over HTTP/2 when h2 is installed
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Optional: faster JSON parsing and serialization for large tile lists
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional: stream multipart uploads from disk instead of building them in memory
+try:
+    from requests_toolbelt.multipart.encoder import MultipartEncoder
+except ImportError:
+    MultipartEncoder = None
+
+# The backend binds 0.0.0.0 (IPv4 only); a literal address skips name resolution
+# and the refused ::1 attempt that "localhost" can cost on every new connection
+DEFAULT_BASE_URL = "http://127.0.0.1:8000"
+
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+# (connect, read) timeout in seconds for health probes
+HEALTH_CHECK_TIMEOUT = (0.5, 2.0)
+
+# Health probes are retried exactly once, without backoff
+HEALTH_CHECK_RETRIES = 1
+EXPORT_BUFFER_SIZE = 1 << 20
+
+# Tile id in names like tile_000001.tif (or .vrt for virtual tiles)
+TILE_ID_PATTERN = re.compile(r'_(\d+)\.(?:tif|vrt)$')
+
+def parse_json(response):
+    """Decode a JSON response body, with orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+def dump_json(obj):
+    """Serialize to indented JSON bytes, with orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
 
 class RasterLabClient:
     """Simple client for RasterLab API"""
     
-    def __init__(self, base_url="http://localhost:8000"):
+    def __init__(self, base_url=DEFAULT_BASE_URL):
         self.base_url = base_url
+        
+        # One session for all calls so connections are kept alive and reused
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.2)
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        
+        # Health probes get their own session so the upload retry policy does not stretch them
+        self.health_session = requests.Session()
+        health_adapter = HTTPAdapter(max_retries=Retry(total=HEALTH_CHECK_RETRIES, backoff_factor=0))
+        self.health_session.mount("http://", health_adapter)
+        self.health_session.mount("https://", health_adapter)
+    
+    def close(self):
+        """Close the underlying HTTP sessions"""
+        self.session.close()
+        self.health_session.close()
     
-    def health_check(self):
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def health_check(self, timeout=HEALTH_CHECK_TIMEOUT):
         """Check if the API is running"""
         try:
-            response = requests.get(f"{self.base_url}/health")
+            response = self.health_session.get(f"{self.base_url}/health", timeout=timeout)
             return response.status_code == 200
-        except requests.exceptions.ConnectionError:
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
             return False
     
+    @classmethod
+    async def pick_healthy(cls, base_urls, timeout=HEALTH_CHECK_TIMEOUT):
+        """Probe several API instances concurrently and return the first healthy base URL (or None)"""
+        if httpx is None:
+            raise ImportError("pick_healthy requires httpx")
+        
+        connect_timeout, read_timeout = timeout
+        
+        async with httpx.AsyncClient(timeout=httpx.Timeout(read_timeout, connect=connect_timeout)) as client:
+            async def probe(base_url):
+                try:
+                    response = await client.get(f"{base_url}/health")
+                    return response.status_code == 200
+                except httpx.HTTPError:
+                    return False
+            
+            healthy = await asyncio.gather(*[probe(base_url) for base_url in base_urls])
+        
+        return next((base_url for base_url, ok in zip(base_urls, healthy) if ok), None)
+    
     def upload_geotiff(self, file_path, tile_width=256, tile_height=256, overlap=0.25):
         """Upload and process a GeoTIFF file"""
         url = f"{self.base_url}/upload-geotiff"
         
         with open(file_path, 'rb') as f:
-            files = {'file': f}
             data = {
-                'tile_width': tile_width,
-                'tile_height': tile_height,
-                'overlap': overlap
+                'tile_width': str(tile_width),
+                'tile_height': str(tile_height),
+                'overlap': str(overlap)
             }
             
-            response = requests.post(url, files=files, data=data)
+            if MultipartEncoder is not None:
+                # Body is read from the file as it is sent, with a known Content-Length
+                encoder = MultipartEncoder(
+                    fields={'file': (os.path.basename(file_path), f, 'image/tiff'), **data}
+                )
+                response = self.session.post(
+                    url, data=encoder, headers={'Content-Type': encoder.content_type}
+                )
+            else:
+                response = self.session.post(url, files={'file': f}, data=data)
+            response.raise_for_status()
+            return parse_json(response)
+    
+    def _download(self, url, output_path):
+        """Stream a response body to disk in 1 MiB chunks instead of buffering it"""
+        # Tile data is already DEFLATE-compressed: ask for the bytes as stored and copy them undecoded
+        with self.session.get(url, stream=True, headers={'Accept-Encoding': 'identity'}) as response:
             response.raise_for_status()
-            return response.json()
+            response.raw.decode_content = False
+            with open(output_path, 'wb') as f:
+                shutil.copyfileobj(response.raw, f, length=DOWNLOAD_CHUNK_SIZE)
+        
+        return output_path
     
     def download_tile(self, session_id, filename, output_path=None):
         """Download a specific tile"""
         url = f"{self.base_url}/download-tile/{session_id}/{filename}"
         
-        response = requests.get(url)
-        response.raise_for_status()
-        
         if output_path is None:
             output_path = filename
         
-        with open(output_path, 'wb') as f:
-            f.write(response.content)
-        
-        return output_path
+        return self._download(url, output_path)
     
     def download_all_tiles(self, session_id, output_path=None):
         """Download all tiles as ZIP"""
         url = f"{self.base_url}/download-all-tiles/{session_id}"
         
-        response = requests.get(url)
+        if output_path is None:
+            output_path = f"tiles_{session_id}.zip"
+        
+        return self._download(url, output_path)
+    
+    def list_tiles(self, session_id):
+        """List all tiles in a session"""
+        url = f"{self.base_url}/list-tiles/{session_id}"
+        
+        response = self.session.get(url)
+        response.raise_for_status()
+        return parse_json(response)
+    
+    def cleanup_session(self, session_id):
+        """Clean up a session"""
+        url = f"{self.base_url}/cleanup-session/{session_id}"
+        
+        response = self.session.delete(url)
         response.raise_for_status()
+        return parse_json(response)
+
+class AsyncRasterLabClient:
+    """Async client for RasterLab API, for fetching many tiles concurrently"""
+    
+    def __init__(self, base_url=DEFAULT_BASE_URL, max_concurrency=16):
+        if httpx is None:
+            raise ImportError("AsyncRasterLabClient requires httpx")
+        
+        self.base_url = base_url
+        self.client = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=32)
+        )
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+    
+    async def close(self):
+        """Close the underlying HTTP client"""
+        await self.client.aclose()
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+    
+    async def download_tile(self, session_id, filename, output_path=None):
+        """Download a specific tile"""
+        url = f"{self.base_url}/download-tile/{session_id}/{filename}"
         
         if output_path is None:
-            output_path = f"tiles_{session_id}.zip"
+            output_path = filename
         
-        with open(output_path, 'wb') as f:
-            f.write(response.content)
+        async with self.semaphore:
+            async with self.client.stream("GET", url) as response:
+                response.raise_for_status()
+                with open(output_path, 'wb') as f:
+                    async for chunk in response.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+                        f.write(chunk)
         
         return output_path
     
-    def list_tiles(self, session_id):
+    async def list_tiles(self, session_id):
         """List all tiles in a session"""
         url = f"{self.base_url}/list-tiles/{session_id}"
         
-        response = requests.get(url)
+        response = await self.client.get(url)
         response.raise_for_status()
-        return response.json()
+        return parse_json(response)
     
-    def cleanup_session(self, session_id):
+    async def cleanup_session(self, session_id):
         """Clean up a session"""
         url = f"{self.base_url}/cleanup-session/{session_id}"
         
-        response = requests.delete(url)
+        response = await self.client.delete(url)
         response.raise_for_status()
-        return response.json()
+        return parse_json(response)
+    
+    async def download_all_individually(self, session_id, output_dir="."):
+        """Download every tile of a session concurrently; returns the output paths"""
+        tile_list = await self.list_tiles(session_id)
+        
+        return await asyncio.gather(*[
+            self.download_tile(session_id, tile['filename'], os.path.join(output_dir, tile['filename']))
+            for tile in tile_list['tiles']
+        ])
 
 def example_basic_processing():
     """Example: Basic GeoTIFF processing"""
@@ -124,44 +298,61 @@ def example_batch_processing():
         print("ERROR: RasterLab API is not running")
         return
     
-    # Find all GeoTIFF files in current directory
-    tif_files = list(Path('.').glob('*.tif'))
+    # Find all GeoTIFF files in current directory (DirEntry.is_file avoids a stat per entry)
+    with os.scandir('.') as entries:
+        tif_files = [
+            entry for entry in entries
+            if entry.is_file() and entry.name.lower().endswith(('.tif', '.tiff'))
+        ]
     
     if not tif_files:
         print("No GeoTIFF files found in current directory")
         return
     
-    results = []
-    
-    for file_path in tif_files:
-        print(f"Processing {file_path.name}...")
-        
+    def process_file(entry):
+        """Upload, download and clean up one file; returns (name, result or error)"""
         try:
             result = client.upload_geotiff(
-                str(file_path), 
+                entry.path, 
                 tile_width=256, 
                 tile_height=256, 
                 overlap=0.1
             )
             
-            results.append({
-                'file': file_path.name,
-                'tiles': result['total_tiles'],
-                'session_id': result['session_id']
-            })
-            
-            print(f"  ✓ Generated {result['total_tiles']} tiles")
-            
             # Download tiles
-            zip_path = f"output_{file_path.stem}.zip"
+            zip_path = f"output_{os.path.splitext(entry.name)[0]}.zip"
             client.download_all_tiles(result['session_id'], zip_path)
-            print(f"  ✓ Downloaded to {zip_path}")
             
             # Clean up
             client.cleanup_session(result['session_id'])
             
+            return entry.name, {
+                'file': entry.name,
+                'tiles': result['total_tiles'],
+                'session_id': result['session_id'],
+                'zip_path': zip_path
+            }
         except Exception as e:
-            print(f"  ✗ Error: {e}")
+            return entry.name, e
+    
+    print(f"Processing {len(tif_files)} files...")
+    
+    # Files are processed concurrently over the client's shared connection pool
+    with ThreadPoolExecutor(max_workers=min(8, len(tif_files))) as executor:
+        outcomes = list(executor.map(process_file, tif_files))
+    
+    results = []
+    
+    for name, outcome in outcomes:
+        print(f"{name}:")
+        
+        if isinstance(outcome, Exception):
+            print(f"  ✗ Error: {outcome}")
+            continue
+        
+        results.append(outcome)
+        print(f"  ✓ Generated {outcome['tiles']} tiles")
+        print(f"  ✓ Downloaded to {outcome['zip_path']}")
     
     print(f"\n✓ Processed {len(results)} files successfully")
 
@@ -224,9 +415,11 @@ def example_metadata_export():
     result = client.upload_geotiff(file_path)
     
     # Export metadata as JSON
+    # Exports are written to a .tmp file and renamed into place, so readers never see a partial file
     metadata_file = f"metadata_{result['session_id']}.json"
-    with open(metadata_file, 'w') as f:
-        json.dump(result, f, indent=2)
+    with open(metadata_file + ".tmp", 'wb', buffering=EXPORT_BUFFER_SIZE) as f:
+        f.write(dump_json(result))
+    os.replace(metadata_file + ".tmp", metadata_file)
     
     print(f"✓ Metadata exported to: {metadata_file}")
     
@@ -234,16 +427,52 @@ def example_metadata_export():
     tile_list = client.list_tiles(result['session_id'])
     csv_file = f"tiles_{result['session_id']}.csv"
     
-    with open(csv_file, 'w') as f:
-        f.write("Tile ID,Filename,Size (bytes),Download URL\n")
-        for tile in tile_list['tiles']:
-            f.write(f"{tile['filename'].split('_')[1].split('.')[0]},{tile['filename']},{tile['size_bytes']},{tile['download_url']}\n")
+    with open(csv_file + ".tmp", 'w', newline='', buffering=EXPORT_BUFFER_SIZE) as f:
+        writer = csv.writer(f)
+        writer.writerow(["Tile ID", "Filename", "Size (bytes)", "Download URL"])
+        writer.writerows(
+            (TILE_ID_PATTERN.search(tile['filename']).group(1), tile['filename'], tile['size_bytes'], tile['download_url'])
+            for tile in tile_list['tiles']
+        )
+    os.replace(csv_file + ".tmp", csv_file)
     
     print(f"✓ Tile list exported to: {csv_file}")
     
     # Clean up
     client.cleanup_session(result['session_id'])
 
+def example_async_downloads():
+    """Example: Downloading individual tiles concurrently"""
+    print("\n=== Async Tile Downloads Example ===")
+    
+    if httpx is None:
+        print("ERROR: httpx is not installed")
+        return
+    
+    client = RasterLabClient()
+    
+    if not client.health_check():
+        print("ERROR: RasterLab API is not running")
+        return
+    
+    file_path = "test_raster.tif"
+    if not os.path.exists(file_path):
+        print(f"ERROR: Test file {file_path} not found")
+        return
+    
+    result = client.upload_geotiff(file_path)
+    output_dir = f"tiles_{result['session_id']}"
+    os.makedirs(output_dir, exist_ok=True)
+    
+    async def download():
+        async with AsyncRasterLabClient() as async_client:
+            paths = await async_client.download_all_individually(result['session_id'], output_dir)
+            await async_client.cleanup_session(result['session_id'])
+            return paths
+    
+    paths = asyncio.run(download())
+    print(f"✓ Downloaded {len(paths)} tiles to: {output_dir}")
+
 if __name__ == "__main__":
     print("RasterLab API Examples")
     print("======================")
@@ -253,5 +482,6 @@ if __name__ == "__main__":
     example_batch_processing()
     example_custom_parameters()
     example_metadata_export()
+    example_async_downloads()
     
     print("\n✓ All examples completed!")
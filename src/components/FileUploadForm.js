@@ -1,5 +1,10 @@
 import React, { useState, useRef } from 'react';
 
+export const isValidGeoTiff = (file) => {
+  const name = file.name.toLowerCase();
+  return name.endsWith('.tif') || name.endsWith('.tiff');
+};
+
 const FileUploadForm = ({ onSubmit, loading }) => {
   const [selectedFile, setSelectedFile] = useState(null);
   const [tileSize, setTileSize] = useState(256);
@@ -24,7 +29,7 @@ const FileUploadForm = ({ onSubmit, loading }) => {
   ];
 
   const handleFileSelect = (file) => {
-    if (file && (file.name.toLowerCase().endsWith('.tif') || file.name.toLowerCase().endsWith('.tiff'))) {
+    if (file && isValidGeoTiff(file)) {
       setSelectedFile(file);
     } else {
       alert('Please select a valid GeoTIFF file (.tif or .tiff)');
@@ -159,7 +164,7 @@ const FileUploadForm = ({ onSubmit, loading }) => {
       <form onSubmit={handleSubmit} className="space-y-8">
         {/* File Upload */}
         <div>
-          <label className="block text-lg font-semibold text-gray-700 mb-4">
+          <label htmlFor="geotiff-file" className="block text-lg font-semibold text-gray-700 mb-4">
             GeoTIFF File
           </label>
           <div
@@ -172,6 +177,7 @@ const FileUploadForm = ({ onSubmit, loading }) => {
             onClick={() => fileInputRef.current?.click()}
           >
             <input
+              id="geotiff-file"
               ref={fileInputRef}
               type="file"
               accept=".tif,.tiff"
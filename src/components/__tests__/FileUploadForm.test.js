@@ -0,0 +1,226 @@
+/**
+ * FileUploadForm component tests for RasterLab
+ *
+ * jsdom does not need to emulate a visual browser (no requestAnimationFrame timers) for these tests.
+ *
+ * @jest-environment jsdom
+ * @jest-environment-options {"pretendToBeVisual": false}
+ */
+import React from 'react';
+// The pure entry point skips RTL's automatic cleanup so FileUploadForm can stay mounted across tests
+import { render, screen, fireEvent, act, cleanup } from '@testing-library/react/pure';
+import '@testing-library/jest-dom';
+import FileUploadForm, { isValidGeoTiff } from '../FileUploadForm';
+
+// The pure entry point does not flag the act() environment itself
+globalThis.IS_REACT_ACT_ENVIRONMENT = true;
+
+// Mock fetch for API calls
+global.fetch = jest.fn();
+const mockOnSubmit = jest.fn();
+
+// jsdom's window.alert only logs "not implemented"; replace it once for the whole file
+beforeAll(() => {
+  window.alert = jest.fn();
+});
+
+// One hook clears every mock for every test in the file
+beforeEach(() => {
+  fetch.mockClear();
+  mockOnSubmit.mockClear();
+  window.alert.mockClear();
+});
+
+// Shared fixtures, built once for the whole file. The form only reads name (and appends the
+// file to FormData), so frozen stubs stand in for jsdom File objects and their Blob storage.
+const fileStub = (name, type) => {
+  const stub = Object.freeze({
+    name,
+    type,
+    size: 12,
+    slice: () => stub,
+    arrayBuffer: async () => new ArrayBuffer(0),
+  });
+  return stub;
+};
+const TIF_FILE = fileStub('test.tif', 'image/tiff');
+const TXT_FILE = fileStub('test.txt', 'text/plain');
+
+// jsdom has no usable DataTransfer, so drop events get this minimal stand-in
+class MockDataTransfer {
+  constructor(files) {
+    this.files = files;
+    this.items = files.map((file) => ({ kind: 'file', type: file.type, getAsFile: () => file }));
+    this.types = ['Files'];
+  }
+}
+
+// Query matchers, compiled once
+const FILE_RE = /file/i;
+const CUSTOM_TILE_RE = /custom tile size/i;
+const CUSTOM_OVERLAP_RE = /custom overlap/i;
+const FORM_TEXT_RE = /Upload GeoTIFF File[\s\S]*Tile Size \(Pixels\)[\s\S]*Overlap Ratio[\s\S]*Generate Tiles/;
+
+// Event init helpers for fireEvent.change
+const changeTo = (value) => ({ target: { value } });
+const selectFiles = (...files) => ({ target: { files } });
+const DEFAULT_TILE_SIZE_CHANGE = changeTo('256');
+const DEFAULT_OVERLAP_CHANGE = changeTo('0.25');
+
+describe('FileUploadForm', () => {
+  let utils;
+
+  // Mount once; each test starts from the default form state restored in afterEach
+  beforeAll(() => {
+    utils = render(<FileUploadForm onSubmit={mockOnSubmit} loading={false} />);
+  });
+
+  afterAll(() => {
+    cleanup();
+  });
+
+  afterEach(() => {
+    const removeButton = screen.queryByText('Remove file');
+    if (removeButton) {
+      fireEvent.click(removeButton);
+    }
+
+    // The two resets are independent, so let React commit them together
+    const [tileSizeSelect, overlapSelect] = utils.container.querySelectorAll('select');
+    act(() => {
+      fireEvent.change(tileSizeSelect, DEFAULT_TILE_SIZE_CHANGE);
+      fireEvent.change(overlapSelect, DEFAULT_OVERLAP_CHANGE);
+    });
+  });
+
+  test('renders file upload form with all elements', () => {
+    // One match over the rendered text, in form order
+    expect(utils.container.textContent).toMatch(FORM_TEXT_RE);
+  });
+
+  test('handles file selection via input', () => {
+    const input = screen.getByLabelText(FILE_RE);
+    
+    fireEvent.change(input, selectFiles(TIF_FILE));
+    
+    expect(screen.getByText('test.tif')).toBeInTheDocument();
+    expect(screen.getByText('File ready for processing')).toBeInTheDocument();
+  });
+
+  test('handles file selection via drag and drop', () => {
+    const dropZone = screen.getByText('Click to upload');
+    
+    fireEvent.dragOver(dropZone);
+    fireEvent.drop(dropZone, { dataTransfer: new MockDataTransfer([TIF_FILE]) });
+    
+    expect(screen.getByText('test.tif')).toBeInTheDocument();
+  });
+
+  test('rejects invalid file types', () => {
+    const input = screen.getByLabelText(FILE_RE);
+    
+    fireEvent.change(input, selectFiles(TXT_FILE));
+    
+    expect(window.alert).toHaveBeenCalledWith('Please select a valid GeoTIFF file (.tif or .tiff)');
+    expect(screen.queryByText('File ready for processing')).not.toBeInTheDocument();
+  });
+
+  test('handles tile size selection', () => {
+    const tileSizeSelect = screen.getByDisplayValue('256×256');
+    fireEvent.change(tileSizeSelect, changeTo('512'));
+    
+    expect(tileSizeSelect.value).toBe('512');
+  });
+
+  test('handles custom tile size input', () => {
+    // Select custom option
+    const tileSizeSelect = screen.getByDisplayValue('256×256');
+    fireEvent.change(tileSizeSelect, changeTo('custom'));
+    
+    // Enter custom size
+    const customInput = screen.getByPlaceholderText(CUSTOM_TILE_RE);
+    fireEvent.change(customInput, changeTo('512x256'));
+    
+    expect(customInput.value).toBe('512x256');
+  });
+
+  test('handles overlap ratio selection', () => {
+    const overlapSelect = screen.getByDisplayValue('0.25 (25%)');
+    fireEvent.change(overlapSelect, changeTo('0.5'));
+    
+    expect(overlapSelect.value).toBe('0.5');
+  });
+
+  test('handles custom overlap input', () => {
+    // Select custom overlap
+    const overlapSelect = screen.getByDisplayValue('0.25 (25%)');
+    fireEvent.change(overlapSelect, changeTo('custom'));
+    
+    // Enter custom overlap
+    const customInput = screen.getByPlaceholderText(CUSTOM_OVERLAP_RE);
+    fireEvent.change(customInput, changeTo('0.75'));
+    
+    expect(customInput.value).toBe('0.75');
+  });
+
+  test('submits form with valid data', () => {
+    // Select file
+    const input = screen.getByLabelText(FILE_RE);
+    fireEvent.change(input, selectFiles(TIF_FILE));
+    
+    // Submit form
+    const submitButton = screen.getByText('Generate Tiles');
+    fireEvent.click(submitButton);
+    
+    expect(mockOnSubmit).toHaveBeenCalledTimes(1);
+    expect(mockOnSubmit).toHaveBeenCalledWith(expect.any(FormData));
+  });
+
+  test('prevents submission without file', () => {
+    // The submit button stays disabled until a file is selected
+    const submitButton = screen.getByText('Generate Tiles').closest('button');
+    expect(submitButton).toBeDisabled();
+    
+    fireEvent.click(submitButton);
+    
+    expect(mockOnSubmit).not.toHaveBeenCalled();
+  });
+
+  test('removes selected file', () => {
+    // Select file
+    const input = screen.getByLabelText(FILE_RE);
+    fireEvent.change(input, selectFiles(TIF_FILE));
+    
+    // Remove file
+    const removeButton = screen.getByText('Remove file');
+    fireEvent.click(removeButton);
+    
+    expect(screen.getByText('Click to upload')).toBeInTheDocument();
+    expect(screen.queryByText('Remove file')).not.toBeInTheDocument();
+  });
+});
+
+describe('FileUploadForm while loading', () => {
+  // The loading prop is fixed for the shared instance above, so this state gets its own mount
+  afterEach(() => {
+    cleanup();
+  });
+
+  test('shows loading state', () => {
+    render(<FileUploadForm onSubmit={jest.fn()} loading={true} />);
+    
+    expect(screen.getByText('Processing GeoTIFF...')).toBeInTheDocument();
+    expect(screen.getByRole('button')).toBeDisabled();
+  });
+});
+
+describe('isValidGeoTiff', () => {
+  test('accepts .tif and .tiff files', () => {
+    expect(isValidGeoTiff(TIF_FILE)).toBe(true);
+    expect(isValidGeoTiff({ name: 'SCENE.TIFF' })).toBe(true);
+  });
+
+  test('rejects invalid file types', () => {
+    expect(isValidGeoTiff(TXT_FILE)).toBe(false);
+  });
+});
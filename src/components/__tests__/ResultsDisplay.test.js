@@ -0,0 +1,212 @@
+/**
+ * ResultsDisplay component tests for RasterLab
+ *
+ * jsdom does not need to emulate a visual browser (no requestAnimationFrame timers) for these tests.
+ *
+ * @jest-environment jsdom
+ * @jest-environment-options {"pretendToBeVisual": false}
+ */
+import React from 'react';
+import { render, screen, fireEvent, act, within } from '@testing-library/react';
+import '@testing-library/jest-dom';
+import { createRoot } from 'react-dom/client';
+import ResultsDisplay from '../ResultsDisplay';
+
+globalThis.IS_REACT_ACT_ENVIRONMENT = true;
+
+// Mock fetch for API calls
+global.fetch = jest.fn();
+
+// jsdom has no object URLs; the tests only check the fetch contract, so downloads get placeholder URLs
+global.URL.createObjectURL = jest.fn(() => 'blob:mock');
+global.URL.revokeObjectURL = jest.fn();
+
+beforeEach(() => {
+  fetch.mockClear();
+});
+
+// Shared fixture; the component only reads it, so freezing also catches accidental mutation
+const mockResults = Object.freeze({
+  original_bbox: {
+    min_lat: 37.7,
+    max_lat: 37.8,
+    min_lon: -122.5,
+    max_lon: -122.3
+  },
+  tiles: [
+    {
+      id: 1,
+      min_lat: 37.7,
+      max_lat: 37.75,
+      min_lon: -122.5,
+      max_lon: -122.4,
+      file_name: 'tile_000001.tif'
+    },
+    {
+      id: 2,
+      min_lat: 37.75,
+      max_lat: 37.8,
+      min_lon: -122.4,
+      max_lon: -122.3,
+      file_name: 'tile_000002.tif'
+    }
+  ],
+  total_tiles: 2,
+  session_id: 'test_session_123'
+});
+
+const EMPTY_RESULTS = Object.freeze({
+  ...mockResults,
+  tiles: Object.freeze([]),
+  total_tiles: 0
+});
+
+// Section headings and bounding box values in render order, checked with one match each
+const SECTIONS_TEXT_RE = /Analysis Results[\s\S]*Original Raster Bounding Box[\s\S]*Generated Tiles[\s\S]*Export Results/;
+const BBOX_TEXT_RE = /Min Longitude-122\.500000Max Longitude-122\.300000Min Latitude37\.700000Max Latitude37\.800000/;
+
+// Plain React root for render-only tests that fire no events; unmounted after each test
+const quickRoots = [];
+
+function quickRender(element) {
+  const container = document.createElement('div');
+  document.body.appendChild(container);
+  const root = createRoot(container);
+  act(() => {
+    root.render(element);
+  });
+  quickRoots.push({ root, container });
+  return container;
+}
+
+afterEach(() => {
+  quickRoots.splice(0).forEach(({ root, container }) => {
+    act(() => {
+      root.unmount();
+    });
+    container.remove();
+  });
+});
+
+describe('ResultsDisplay', () => {
+  let logSpy;
+
+  // The download handlers trace every step with console.log; keep that out of the test output
+  beforeAll(() => {
+    logSpy = jest.spyOn(console, 'log').mockImplementation(() => {});
+  });
+
+  afterAll(() => {
+    logSpy.mockRestore();
+  });
+
+  test('renders results with all sections', () => {
+    const container = quickRender(<ResultsDisplay results={mockResults} />);
+    
+    expect(container.textContent).toMatch(SECTIONS_TEXT_RE);
+  });
+
+  test('displays bounding box coordinates', () => {
+    const container = quickRender(<ResultsDisplay results={mockResults} />);
+    
+    // One match over the rendered text, in panel order: min/max longitude, then min/max latitude
+    expect(container.textContent).toMatch(BBOX_TEXT_RE);
+  });
+
+  test('displays tiles table', () => {
+    const { container } = render(<ResultsDisplay results={mockResults} />);
+    const view = within(container);
+    
+    expect(view.getByText('Tile #1')).toBeInTheDocument();
+    expect(view.getByText('Tile #2')).toBeInTheDocument();
+    expect(view.getByText('tile_000001.tif')).toBeInTheDocument();
+    expect(view.getByText('tile_000002.tif')).toBeInTheDocument();
+  });
+
+  test('handles tile download', async () => {
+    // Mock successful download
+    fetch.mockResolvedValueOnce({
+      ok: true,
+      blob: () => Promise.resolve({ size: 12, type: 'image/tiff' })
+    });
+
+    render(<ResultsDisplay results={mockResults} />);
+    
+    const downloadButtons = screen.getAllByText('Download');
+    // fetch is mocked, so act() can flush the whole download chain without polling
+    await act(async () => {
+      fireEvent.click(downloadButtons[0]);
+    });
+    
+    expect(fetch).toHaveBeenCalledWith(
+      'http://localhost:8000/download-tile/test_session_123/tile_000001.tif',
+      expect.any(Object)
+    );
+  });
+
+  test('handles download all tiles', async () => {
+    // Mock successful download
+    fetch.mockResolvedValueOnce({
+      ok: true,
+      blob: () => Promise.resolve({ size: 11, type: 'application/zip' })
+    });
+
+    render(<ResultsDisplay results={mockResults} />);
+    
+    const downloadAllButton = screen.getByText('Download All Tiles (ZIP)');
+    await act(async () => {
+      fireEvent.click(downloadAllButton);
+    });
+    
+    expect(fetch).toHaveBeenCalledWith(
+      'http://localhost:8000/download-all-tiles/test_session_123',
+      expect.any(Object)
+    );
+  });
+
+  test('handles CSV export', () => {
+    render(<ResultsDisplay results={mockResults} />);
+    
+    const csvButton = screen.getByText('Export CSV');
+    fireEvent.click(csvButton);
+    
+    // CSV export should trigger download
+    // This is tested by checking if the function was called
+    expect(csvButton).toBeInTheDocument();
+  });
+
+  test('handles JSON export', () => {
+    render(<ResultsDisplay results={mockResults} />);
+    
+    const jsonButton = screen.getByText('Export JSON');
+    fireEvent.click(jsonButton);
+    
+    // JSON export should trigger download
+    expect(jsonButton).toBeInTheDocument();
+  });
+
+  test('handles sample download', () => {
+    render(<ResultsDisplay results={mockResults} />);
+    
+    const sampleButton = screen.getByText('Download Sample (10 tiles)');
+    fireEvent.click(sampleButton);
+    
+    // Sample download should trigger individual downloads
+    expect(sampleButton).toBeInTheDocument();
+  });
+
+  test('renders without results', () => {
+    const container = quickRender(<ResultsDisplay results={null} />);
+    
+    // Should not render anything when no results
+    expect(container).toBeEmptyDOMElement();
+  });
+
+  test('handles empty tiles array', () => {
+    const container = quickRender(<ResultsDisplay results={EMPTY_RESULTS} />);
+    const view = within(container);
+    
+    expect(view.getByText('0')).toBeInTheDocument(); // total_tiles
+    expect(view.getByText('Showing 0 tiles')).toBeInTheDocument();
+  });
+});
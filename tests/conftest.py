@@ -0,0 +1,52 @@
+"""
+Shared fixtures for RasterLab backend tests
+"""
+import pytest
+import os
+import httpx
+from fastapi.testclient import TestClient
+from backend.main import app
+
+# Optional: decode test responses with orjson when it is installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+SAMPLE_GEOTIFF_PATH = "test_raster.tif"
+
+def pytest_configure(config):
+    """Keep xdist_group-marked tests on one worker whenever pytest-xdist is used"""
+    # Upload tests share same-second session ids, so plain `-n auto` must not spread them
+    if getattr(config.option, "numprocesses", None) and config.option.dist in ("no", "load"):
+        config.option.dist = "loadgroup"
+
+@pytest.fixture(scope="session", autouse=True)
+def fast_json():
+    """Make response.json() use orjson for the whole session"""
+    if orjson is None:
+        yield
+        return
+    
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr(httpx.Response, "json", lambda self, **kwargs: orjson.loads(self.content))
+        yield
+
+@pytest.fixture(scope="session")
+def client():
+    """One TestClient per test session (or per xdist worker)"""
+    with TestClient(app) as test_client:
+        yield test_client
+
+@pytest.fixture(scope="session")
+def sample_geotiff():
+    """Path to the sample GeoTIFF used for testing"""
+    if not os.path.exists(SAMPLE_GEOTIFF_PATH):
+        pytest.skip("Test GeoTIFF file not found")
+    return SAMPLE_GEOTIFF_PATH
+
+@pytest.fixture(scope="session")
+def sample_geotiff_bytes(sample_geotiff):
+    """Contents of the sample GeoTIFF, read once for all tests"""
+    with open(sample_geotiff, "rb") as f:
+        return f.read()
@@ -2,40 +2,28 @@
 Integration tests for the complete RasterLab workflow
 """
 import pytest
-import tempfile
+import io
 import os
+import tempfile
 import zipfile
-from fastapi.testclient import TestClient
-from backend.main import app
-
-client = TestClient(app)
-
-@pytest.fixture
-def sample_geotiff():
-    """Create a sample GeoTIFF file for testing"""
-    test_file_path = "test_raster.tif"
-    if os.path.exists(test_file_path):
-        return test_file_path
-    else:
-        pytest.skip("Test GeoTIFF file not found")
 
+@pytest.mark.xdist_group("upload")
 class TestFullWorkflow:
     """Test the complete workflow from upload to download"""
     
-    def test_complete_workflow(self, sample_geotiff):
+    def test_complete_workflow(self, client, sample_geotiff_bytes):
         """Test the complete workflow: upload -> process -> download"""
         
         # Step 1: Upload and process GeoTIFF
-        with open(sample_geotiff, "rb") as f:
-            upload_response = client.post(
-                "/upload-geotiff",
-                files={"file": f},
-                data={
-                    "tile_width": 256,
-                    "tile_height": 256,
-                    "overlap": 0.25
-                }
-            )
+        upload_response = client.post(
+            "/upload-geotiff",
+            files={"file": ("test_raster.tif", io.BytesIO(sample_geotiff_bytes), "image/tiff")},
+            data={
+                "tile_width": 256,
+                "tile_height": 256,
+                "overlap": 0.25
+            }
+        )
         
         assert upload_response.status_code == 200
         upload_data = upload_response.json()
@@ -65,14 +53,19 @@ class TestFullWorkflow:
             assert download_response.status_code == 200
             assert download_response.headers["content-type"] == "image/tiff"
             
-        # Step 4: Download all tiles as ZIP
-        zip_response = client.get(f"/download-all-tiles/{session_id}")
-        assert zip_response.status_code == 200
-        assert zip_response.headers["content-type"] == "application/zip"
+        # Step 4: Download all tiles as ZIP, spooling the stream to bound memory
+        with client.stream("GET", f"/download-all-tiles/{session_id}") as zip_response:
+            assert zip_response.status_code == 200
+            assert zip_response.headers["content-type"] == "application/zip"
+            
+            zip_buffer = tempfile.SpooledTemporaryFile(max_size=64 << 20)
+            for chunk in zip_response.iter_bytes(1 << 20):
+                zip_buffer.write(chunk)
         
         # Verify ZIP content
-        zip_content = zip_response.content
-        assert len(zip_content) > 0
+        zip_buffer.seek(0)
+        with zip_buffer, zipfile.ZipFile(zip_buffer) as zip_file:
+            assert len(zip_file.namelist()) == upload_data["total_tiles"]
         
         # Step 5: Cleanup session
         cleanup_response = client.delete(f"/cleanup-session/{session_id}")
@@ -83,120 +76,92 @@ class TestFullWorkflow:
         list_after_cleanup = client.get(f"/list-tiles/{session_id}")
         assert list_after_cleanup.status_code == 404
 
-    def test_different_tile_sizes(self, sample_geotiff):
+    @pytest.mark.parametrize("config", [
+        {"width": 128, "height": 128, "overlap": 0.1},
+        {"width": 512, "height": 256, "overlap": 0.5},
+        {"width": 1024, "height": 1024, "overlap": 0.25}
+    ])
+    def test_different_tile_sizes(self, client, sample_geotiff_bytes, config):
         """Test processing with different tile sizes"""
-        tile_configs = [
-            {"width": 128, "height": 128, "overlap": 0.1},
-            {"width": 512, "height": 256, "overlap": 0.5},
-            {"width": 1024, "height": 1024, "overlap": 0.25}
-        ]
-        
-        for config in tile_configs:
-            with open(sample_geotiff, "rb") as f:
-                response = client.post(
-                    "/upload-geotiff",
-                    files={"file": f},
-                    data={
-                        "tile_width": config["width"],
-                        "tile_height": config["height"],
-                        "overlap": config["overlap"]
-                    }
-                )
-            
-            assert response.status_code == 200
-            data = response.json()
-            
-            # Clean up after each test
-            session_id = data["session_id"]
-            client.delete(f"/cleanup-session/{session_id}")
+        response = client.post(
+            "/upload-geotiff",
+            files={"file": ("test_raster.tif", io.BytesIO(sample_geotiff_bytes), "image/tiff")},
+            data={
+                "tile_width": config["width"],
+                "tile_height": config["height"],
+                "overlap": config["overlap"]
+            }
+        )
+        
+        assert response.status_code == 200
+        data = response.json()
+        
+        # Clean up after each test
+        session_id = data["session_id"]
+        client.delete(f"/cleanup-session/{session_id}")
 
-    def test_error_handling(self):
+    def test_error_handling(self, client):
         """Test error handling in the workflow"""
         
         # Test with invalid file
-        with tempfile.NamedTemporaryFile(suffix=".txt", delete=False) as f:
-            f.write(b"Not a GeoTIFF file")
-            f.flush()
-            
-            with open(f.name, "rb") as file:
-                response = client.post(
-                    "/upload-geotiff",
-                    files={"file": file},
-                    data={
-                        "tile_width": 256,
-                        "tile_height": 256,
-                        "overlap": 0.25
-                    }
-                )
-            
-            os.unlink(f.name)
+        response = client.post(
+            "/upload-geotiff",
+            files={"file": ("invalid.txt", io.BytesIO(b"Not a GeoTIFF file"), "text/plain")},
+            data={
+                "tile_width": 256,
+                "tile_height": 256,
+                "overlap": 0.25
+            }
+        )
         
         assert response.status_code == 400
         
         # Test with invalid parameters
-        with tempfile.NamedTemporaryFile(suffix=".tif", delete=False) as f:
-            f.write(b"Fake GeoTIFF content")
-            f.flush()
-            
-            with open(f.name, "rb") as file:
-                response = client.post(
-                    "/upload-geotiff",
-                    files={"file": file},
-                    data={
-                        "tile_width": -256,  # Invalid
-                        "tile_height": 256,
-                        "overlap": 1.5  # Invalid
-                    }
-                )
-            
-            os.unlink(f.name)
+        response = client.post(
+            "/upload-geotiff",
+            files={"file": ("fake.tif", io.BytesIO(b"Fake GeoTIFF content"), "image/tiff")},
+            data={
+                "tile_width": -256,  # Invalid
+                "tile_height": 256,
+                "overlap": 1.5  # Invalid
+            }
+        )
         
         assert response.status_code == 400
 
-    def test_concurrent_uploads(self, sample_geotiff):
+    def test_concurrent_uploads(self, client, sample_geotiff_bytes):
         """Test handling multiple concurrent uploads"""
-        import threading
-        import time
-        
-        results = []
-        errors = []
-        
-        def upload_file():
-            try:
-                with open(sample_geotiff, "rb") as f:
-                    response = client.post(
-                        "/upload-geotiff",
-                        files={"file": f},
-                        data={
-                            "tile_width": 256,
-                            "tile_height": 256,
-                            "overlap": 0.25
-                        }
-                    )
-                results.append(response.status_code == 200)
-            except Exception as e:
-                errors.append(str(e))
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+        
+        def upload_file(i):
+            # A distinct name per upload gives each one its own session
+            return client.post(
+                "/upload-geotiff",
+                files={"file": (f"concurrent_{i}.tif", io.BytesIO(sample_geotiff_bytes), "image/tiff")},
+                data={
+                    "tile_width": 256,
+                    "tile_height": 256,
+                    "overlap": 0.25
+                }
+            )
         
         # Start multiple uploads concurrently
-        threads = []
-        for _ in range(3):
-            thread = threading.Thread(target=upload_file)
-            threads.append(thread)
-            thread.start()
-        
-        # Wait for all threads to complete
-        for thread in threads:
-            thread.join()
-        
-        # Verify all uploads succeeded
-        assert len(errors) == 0, f"Errors occurred: {errors}"
-        assert all(results), "Not all uploads succeeded"
-        
-        # Clean up any created sessions
-        # This is a simplified cleanup - in real scenario, you'd track session IDs
-        time.sleep(1)  # Give time for processing to complete
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [executor.submit(upload_file, i) for i in range(8)]
+            responses = [future.result() for future in as_completed(futures)]
+        
+        # Clean up every session that was created, even if some uploads failed
+        session_ids = [
+            response.json()["session_id"] for response in responses if response.status_code == 200
+        ]
+        for session_id in session_ids:
+            client.delete(f"/cleanup-session/{session_id}")
+        
+        # Verify all uploads succeeded, each in its own session
+        assert [response.status_code for response in responses] == [200] * 8
+        assert len(set(session_ids)) == 8
 
-    def test_large_file_handling(self):
+    def test_large_file_handling(self, client):
         """Test handling of large files (if available)"""
         # This test would require a large GeoTIFF file
         # For now, we'll test the error handling for missing files
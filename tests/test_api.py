@@ -2,32 +2,25 @@
 Backend API tests for RasterLab
 """
 import pytest
-import tempfile
+import io
 import os
-from fastapi.testclient import TestClient
-from backend.main import app
-
-client = TestClient(app)
-
-@pytest.fixture
-def sample_geotiff():
-    """Create a sample GeoTIFF file for testing"""
-    # This would normally create a test GeoTIFF file
-    # For now, we'll use the existing test file
-    test_file_path = "test_raster.tif"
-    if os.path.exists(test_file_path):
-        return test_file_path
-    else:
-        pytest.skip("Test GeoTIFF file not found")
-
-def test_health_check():
+import shutil
+import warnings
+from datetime import datetime
+import numpy as np
+import rasterio
+import rasterio.warp
+from rasterio.crs import CRS
+from rasterio.transform import from_origin
+
+def test_health_check(client):
     """Test the health check endpoint"""
     response = client.get("/health")
     assert response.status_code == 200
     assert response.json()["status"] == "healthy"
     assert response.json()["service"] == "RasterLab API"
 
-def test_root_endpoint():
+def test_root_endpoint(client):
     """Test the root endpoint"""
     response = client.get("/")
     assert response.status_code == 200
@@ -36,7 +29,8 @@ def test_root_endpoint():
     assert "version" in data
     assert "supported_formats" in data
 
-def test_upload_geotiff_success(sample_geotiff):
+@pytest.mark.xdist_group("upload")
+def test_upload_geotiff_success(client, sample_geotiff):
     """Test successful GeoTIFF upload and processing"""
     with open(sample_geotiff, "rb") as f:
         response = client.post(
@@ -80,99 +74,305 @@ def test_upload_geotiff_success(sample_geotiff):
         assert "file_name" in tile
         assert "download_url" in tile
 
-def test_upload_geotiff_invalid_file():
-    """Test upload with invalid file type"""
-    with tempfile.NamedTemporaryFile(suffix=".txt", delete=False) as f:
-        f.write(b"Not a GeoTIFF file")
-        f.flush()
-        
-        with open(f.name, "rb") as file:
-            response = client.post(
-                "/upload-geotiff",
-                files={"file": file},
-                data={
-                    "tile_width": 256,
-                    "tile_height": 256,
-                    "overlap": 0.25
-                }
-            )
-        
-        os.unlink(f.name)
+@pytest.mark.xdist_group("upload")
+def test_upload_geotiff_projected_tile_bounds(client, tmp_path):
+    """Test tile bounds of a projected raster match its reprojected pixel-edge corners"""
+    src_crs = CRS.from_epsg(32633)
+    transform = from_origin(500000, 5000000, 10, 10)
+    raster_path = tmp_path / "utm_bounds.tif"
+    with rasterio.open(
+        raster_path, "w", driver="GTiff", width=600, height=500, count=1,
+        dtype="uint8", crs=src_crs, transform=transform
+    ) as dst:
+        dst.write(np.zeros((1, 500, 600), dtype=np.uint8))
     
-    assert response.status_code == 400
-    assert "Only .tif/.tiff files are allowed" in response.json()["detail"]
+    with open(raster_path, "rb") as f:
+        response = client.post(
+            "/upload-geotiff",
+            files={"file": ("utm_bounds.tif", f, "image/tiff")},
+            data={
+                "tile_width": 256,
+                "tile_height": 256,
+                "overlap": 0.0
+            }
+        )
+    
+    assert response.status_code == 200
+    data = response.json()
+    
+    try:
+        assert data["total_tiles"] > 1
+        for tile in (data["tiles"][0], data["tiles"][-1]):
+            pixels = tile["pixel_bounds"]
+            cols = [pixels["col_start"], pixels["col_end"], pixels["col_end"], pixels["col_start"]]
+            rows = [pixels["row_start"], pixels["row_start"], pixels["row_end"], pixels["row_end"]]
+            xs, ys = zip(*(transform * (col, row) for col, row in zip(cols, rows)))
+            lons, lats = rasterio.warp.transform(src_crs, "EPSG:4326", xs, ys)
+            
+            assert tile["min_lon"] == pytest.approx(min(lons), abs=1e-7)
+            assert tile["max_lon"] == pytest.approx(max(lons), abs=1e-7)
+            assert tile["min_lat"] == pytest.approx(min(lats), abs=1e-7)
+            assert tile["max_lat"] == pytest.approx(max(lats), abs=1e-7)
+    finally:
+        client.delete(f"/cleanup-session/{data['session_id']}")
 
-def test_upload_geotiff_invalid_parameters():
-    """Test upload with invalid parameters"""
-    with tempfile.NamedTemporaryFile(suffix=".tif", delete=False) as f:
-        f.write(b"Fake GeoTIFF content")
-        f.flush()
+@pytest.mark.xdist_group("upload")
+def test_upload_geotiff_virtual_tiles(client, sample_geotiff):
+    """Test generating VRT tiles instead of GeoTIFFs"""
+    with open(sample_geotiff, "rb") as f:
+        response = client.post(
+            "/upload-geotiff",
+            files={"file": ("virtual_tiles.tif", f, "image/tiff")},
+            data={
+                "tile_width": 256,
+                "tile_height": 256,
+                "overlap": 0.25,
+                "materialize": False
+            }
+        )
+    
+    assert response.status_code == 200
+    data = response.json()
+    session_id = data["session_id"]
+    
+    try:
+        assert data["total_tiles"] > 0
+        tile = data["tiles"][0]
+        assert tile["file_name"].endswith(".vrt")
         
-        with open(f.name, "rb") as file:
-            # Test negative tile dimensions
-            response = client.post(
-                "/upload-geotiff",
-                files={"file": file},
-                data={
-                    "tile_width": -256,
-                    "tile_height": 256,
-                    "overlap": 0.25
-                }
-            )
+        list_data = client.get(f"/list-tiles/{session_id}").json()
+        assert list_data["total_tiles"] == data["total_tiles"]
         
-        os.unlink(f.name)
+        download_response = client.get(tile["download_url"])
+        assert download_response.status_code == 200
+        assert download_response.headers["content-type"].startswith("application/xml")
+        assert b"<VRTDataset" in download_response.content
+    finally:
+        client.delete(f"/cleanup-session/{session_id}")
+
+@pytest.mark.parametrize("filename,content,data,expected_detail", [
+    (
+        "invalid.txt", b"Not a GeoTIFF file",
+        {"tile_width": 256, "tile_height": 256, "overlap": 0.25},
+        "Only .tif/.tiff files are allowed"
+    ),
+    (
+        "fake.tif", b"Fake GeoTIFF content",
+        {"tile_width": -256, "tile_height": 256, "overlap": 0.25},
+        "Tile dimensions must be positive"
+    ),
+    (
+        "fake.tif", b"Fake GeoTIFF content",
+        {"tile_width": 256, "tile_height": 256, "overlap": 1.5},  # Invalid overlap > 1
+        "Overlap must be between 0 and 1"
+    ),
+], ids=["invalid_file", "invalid_parameters", "invalid_overlap"])
+def test_upload_geotiff_invalid_request(client, filename, content, data, expected_detail):
+    """Test upload with invalid file type or parameters"""
+    response = client.post(
+        "/upload-geotiff",
+        files={"file": (filename, io.BytesIO(content), "application/octet-stream")},
+        data=data
+    )
     
     assert response.status_code == 400
-    assert "Tile dimensions must be positive" in response.json()["detail"]
+    assert expected_detail in response.json()["detail"]
 
-def test_upload_geotiff_invalid_overlap():
-    """Test upload with invalid overlap value"""
-    with tempfile.NamedTemporaryFile(suffix=".tif", delete=False) as f:
-        f.write(b"Fake GeoTIFF content")
-        f.flush()
-        
-        with open(f.name, "rb") as file:
-            # Test invalid overlap
-            response = client.post(
-                "/upload-geotiff",
-                files={"file": file},
-                data={
-                    "tile_width": 256,
-                    "tile_height": 256,
-                    "overlap": 1.5  # Invalid overlap > 1
-                }
-            )
-        
-        os.unlink(f.name)
+@pytest.mark.xdist_group("upload")
+def test_upload_geotiff_too_many_tiles(client, sample_geotiff):
+    """Test upload requesting more tiles than the server allows"""
+    with open(sample_geotiff, "rb") as f:
+        response = client.post(
+            "/upload-geotiff",
+            files={"file": f},
+            data={
+                "tile_width": 1,
+                "tile_height": 1,
+                "overlap": 0.0
+            }
+        )
+    
+    assert response.status_code == 413
+    assert "Too many tiles requested" in response.json()["detail"]
+
+@pytest.mark.xdist_group("upload")
+def test_upload_geotiff_virtual_tiles_int64(client, tmp_path):
+    """Test 64-bit integer rasters can be tiled as VRTs"""
+    raster_path = tmp_path / "int64_virtual.tif"
+    with rasterio.open(
+        raster_path, "w", driver="GTiff", width=300, height=300, count=1,
+        dtype="int64", crs=CRS.from_epsg(4326), transform=from_origin(-122.5, 37.8, 0.001, 0.001)
+    ) as dst:
+        dst.write(np.zeros((1, 300, 300), dtype=np.int64))
+    
+    with open(raster_path, "rb") as f:
+        response = client.post(
+            "/upload-geotiff",
+            files={"file": ("int64_virtual.tif", f, "image/tiff")},
+            data={"materialize": False}
+        )
+    
+    assert response.status_code == 200
+    data = response.json()
+    
+    try:
+        assert data["total_tiles"] > 0
+        download_response = client.get(data["tiles"][0]["download_url"])
+        assert b'dataType="Int64"' in download_response.content
+    finally:
+        client.delete(f"/cleanup-session/{data['session_id']}")
+
+@pytest.mark.xdist_group("upload")
+def test_upload_geotiff_virtual_tiles_unsupported_dtype(client, tmp_path, monkeypatch):
+    """Test virtual tiles reject band data types without a VRT equivalent up front"""
+    from backend import main
+    
+    monkeypatch.setattr(
+        main, "VRT_DATA_TYPES", {k: v for k, v in main.VRT_DATA_TYPES.items() if k != "uint8"}
+    )
+    raster_path = tmp_path / "uint8_unsupported.tif"
+    with rasterio.open(
+        raster_path, "w", driver="GTiff", width=300, height=300, count=1,
+        dtype="uint8", crs=CRS.from_epsg(4326), transform=from_origin(-122.5, 37.8, 0.001, 0.001)
+    ) as dst:
+        dst.write(np.zeros((1, 300, 300), dtype=np.uint8))
+    
+    with open(raster_path, "rb") as f:
+        response = client.post(
+            "/upload-geotiff",
+            files={"file": ("uint8_unsupported.tif", f, "image/tiff")},
+            data={"materialize": False}
+        )
     
     assert response.status_code == 400
-    assert "Overlap must be between 0 and 1" in response.json()["detail"]
+    assert "Unsupported data type for virtual tiles: uint8" in response.json()["detail"]
+    assert not [name for name in os.listdir(main.TILES_DIR) if name.endswith("_uint8_unsupported")]
 
-def test_download_tile_not_found():
+@pytest.mark.xdist_group("upload")
+def test_upload_geotiff_virtual_tiles_failure_cleanup(client):
+    """Test a failed virtual-tile upload leaves no session directory behind"""
+    from backend import main
+    
+    response = client.post(
+        "/upload-geotiff",
+        files={"file": ("bad_virtual.tif", io.BytesIO(b"Not really a GeoTIFF"), "image/tiff")},
+        data={
+            "tile_width": 256,
+            "tile_height": 256,
+            "overlap": 0.25,
+            "materialize": False
+        }
+    )
+    
+    assert response.status_code == 500
+    assert not [name for name in os.listdir(main.TILES_DIR) if name.endswith("_bad_virtual")]
+
+@pytest.mark.xdist_group("upload")
+def test_upload_geotiff_virtual_tiles_failure_keeps_colliding_session(client, monkeypatch):
+    """Test a failed virtual-tile upload only removes what it created in a colliding session"""
+    from backend import main
+    
+    class FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return cls(2020, 1, 1)
+    
+    monkeypatch.setattr(main, "datetime", FrozenDatetime)
+    session_dir = os.path.join(main.TILES_DIR, "20200101_000000_collision")
+    os.makedirs(session_dir, exist_ok=True)
+    with open(os.path.join(session_dir, "tile_000001.tif"), "wb") as f:
+        f.write(b"tile")
+    
+    try:
+        response = client.post(
+            "/upload-geotiff",
+            files={"file": ("collision.tif", io.BytesIO(b"Not really a GeoTIFF"), "image/tiff")},
+            data={"materialize": False}
+        )
+        
+        assert response.status_code == 500
+        assert os.listdir(session_dir) == ["tile_000001.tif"]
+    finally:
+        shutil.rmtree(session_dir)
+
+def test_download_tile_not_found(client):
     """Test downloading a non-existent tile"""
     response = client.get("/download-tile/nonexistent_session/tile_000001.tif")
     assert response.status_code == 404
     assert "Tile not found" in response.json()["detail"]
 
-def test_download_all_tiles_not_found():
+@pytest.mark.xdist_group("upload")
+def test_download_tile_head(client):
+    """Test probing a tile with HEAD returns its headers without the body"""
+    session_dir = os.path.join("tiles", "head_session")
+    os.makedirs(session_dir, exist_ok=True)
+    with open(os.path.join(session_dir, "tile_000001.tif"), "wb") as f:
+        f.write(b"tile")
+    
+    try:
+        response = client.head("/download-tile/head_session/tile_000001.tif")
+    finally:
+        shutil.rmtree(session_dir)
+    
+    assert response.status_code == 200
+    assert response.headers["content-length"] == "4"
+    assert response.headers["content-type"] == "image/tiff"
+    assert response.content == b""
+
+def test_openapi_schema_operation_ids(client):
+    """Test the OpenAPI schema builds without duplicate operation ids"""
+    from backend import main
+    
+    main.app.openapi_schema = None
+    with warnings.catch_warnings():
+        warnings.filterwarnings("error", message="Duplicate Operation ID")
+        response = client.get("/openapi.json")
+    
+    assert response.status_code == 200
+    operations = response.json()["paths"]["/download-tile/{session_id}/{filename}"]
+    assert set(operations) == {"get", "head"}
+    assert operations["get"]["operationId"] != operations["head"]["operationId"]
+
+@pytest.mark.xdist_group("upload")
+def test_download_tile_accel_redirect(client, monkeypatch):
+    """Test tile downloads are handed off to nginx when X-Accel-Redirect is enabled"""
+    from backend import main
+    
+    session_dir = os.path.join(main.TILES_DIR, "accel_session")
+    os.makedirs(session_dir, exist_ok=True)
+    with open(os.path.join(session_dir, "tile_000001.tif"), "wb") as f:
+        f.write(b"tile")
+    
+    monkeypatch.setattr(main, "TILES_ACCEL_REDIRECT", "/internal-tiles")
+    try:
+        response = client.get("/download-tile/accel_session/tile_000001.tif")
+    finally:
+        shutil.rmtree(session_dir)
+    
+    assert response.status_code == 200
+    assert response.headers["x-accel-redirect"] == "/internal-tiles/accel_session/tile_000001.tif"
+    assert response.headers["content-type"] == "image/tiff"
+    assert response.content == b""
+
+def test_download_all_tiles_not_found(client):
     """Test downloading all tiles for non-existent session"""
     response = client.get("/download-all-tiles/nonexistent_session")
     assert response.status_code == 404
     assert "Session not found" in response.json()["detail"]
 
-def test_list_tiles_not_found():
+def test_list_tiles_not_found(client):
     """Test listing tiles for non-existent session"""
     response = client.get("/list-tiles/nonexistent_session")
     assert response.status_code == 404
     assert "Session not found" in response.json()["detail"]
 
-def test_cleanup_session_not_found():
+def test_cleanup_session_not_found(client):
     """Test cleaning up non-existent session"""
     response = client.delete("/cleanup-session/nonexistent_session")
     assert response.status_code == 404
     assert "Session not found" in response.json()["detail"]
 
-def test_cors_headers():
+def test_cors_headers(client):
     """Test CORS headers are properly set"""
     response = client.options("/upload-geotiff")
     # CORS headers should be present (handled by middleware)
@@ -0,0 +1,23 @@
+"""
+Tests for the example RasterLab API client
+"""
+import socket
+import time
+from examples.basic_usage import RasterLabClient
+
+def test_health_check_bounded_on_unresponsive_server():
+    """Test a server that accepts connections but never answers is probed at most twice"""
+    # A listening socket that never accepts still completes the TCP handshake via its backlog
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as server:
+        server.bind(("127.0.0.1", 0))
+        server.listen(8)
+        port = server.getsockname()[1]
+        
+        with RasterLabClient(f"http://127.0.0.1:{port}") as client:
+            start = time.monotonic()
+            healthy = client.health_check(timeout=(0.2, 0.3))
+            elapsed = time.monotonic() - start
+    
+    assert healthy is False
+    # One attempt plus one retry is ~0.6 s; the upload retry policy would take over 2 s
+    assert elapsed < 1.0